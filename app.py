@@ -1,46 +1,38 @@
 import os
 import sys
 import json
-import threading
 import re
+import bisect
+import textwrap
+import functools
+import string
+import time
 import webbrowser
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import *
 from tkinter import filedialog, colorchooser, font, simpledialog, messagebox, ttk
 from tkinter.messagebox import *
 from tkinter.filedialog import *
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
 import configparser
+import importlib.util
+from dataclasses import dataclass
 
-# Optional imports with fallback
+# Optional modules are imported on first use; only check that they exist here
+SPELLCHECK_AVAILABLE = importlib.util.find_spec('enchant') is not None
+
+# Faster JSON (de)serialization for the recent files list when orjson is installed
 try:
-    import enchant
-    SPELLCHECK_AVAILABLE = True
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
 except ImportError:
-    SPELLCHECK_AVAILABLE = False
-
-# Enhanced drag and drop import with better error handling for PyInstaller
+    _dumps = lambda obj: json.dumps(obj).encode('utf-8')
+    _loads = json.loads
 
+# Drag and drop is set up by TextEditor._try_enable_dnd when the window is created
 DRAG_DROP_AVAILABLE = False
-try:
-    # Check if we're running as a PyInstaller bundle
-    if getattr(sys, 'frozen', False):
-        # Running as PyInstaller bundle - disable drag and drop
-        DRAG_DROP_AVAILABLE = False
-        print("PyInstaller detected - drag and drop disabled")
-    else:
-        # Running as normal Python script
-        from tkinterdnd2 import DND_FILES, TkinterDnD
-        DRAG_DROP_AVAILABLE = True
-        print("tkinterdnd2 loaded successfully")
-except ImportError:
-    DRAG_DROP_AVAILABLE = False
-    print("tkinterdnd2 not available - drag and drop functionality disabled")
-except Exception as e:
-    DRAG_DROP_AVAILABLE = False
-    print(f"Failed to load tkinterdnd2: {e}")
+DND_FILES = None
 
 # Constants
 APP_NAME = "NotoPad Pro"
@@ -48,13 +40,90 @@ APP_VERSION = "1.0"
 CONFIG_FILE = "editor_config.ini"
 RECENT_FILES_FILE = "recent_files.json"
 MAX_RECENT = 10
+RECENT_CHECK_TTL = 30  # seconds a recent file is trusted to still exist
 AUTO_SAVE_INTERVAL = 30  # seconds
 BACKUP_INTERVAL = 300  # 5 minutes
+READ_CHUNK_SIZE = 256 * 1024  # characters per insert when loading a file
+WRITE_CHUNK_LINES = 1000  # lines per write when saving a file
+HIGHLIGHT_MARGIN = 20  # lines highlighted beyond the visible window
+UI_CURSOR = 1  # status bar update flags collected by on_text_change
+UI_TEXT = 2
+
+# Syntax highlighting patterns, compiled once at import
+_PY_KEYWORDS = ['def', 'class', 'if', 'elif', 'else', 'for', 'while', 'try', 'except', 'finally',
+                'import', 'from', 'as', 'return', 'yield', 'lambda', 'with', 'assert', 'break',
+                'continue', 'pass', 'raise', 'and', 'or', 'not', 'in', 'is', 'True', 'False', 'None']
+_PY_KEYWORD_RE = re.compile(r'\b(?:' + '|'.join(_PY_KEYWORDS) + r')\b')
+# Keyword pattern by file extension; add an entry here to highlight another language
+_LANG_RE = {
+    '.py': _PY_KEYWORD_RE,
+    '.pyw': _PY_KEYWORD_RE,
+}
+
+# Maps punctuation to spaces so spell check can tokenize with str.split
+_WORD_STRIPPER = str.maketrans({c: ' ' for c in string.punctuation + '\u2018\u2019\u201c\u201d\u2013\u2014\u2026'})
+
+# Tcl before 9.0 stores text as UTF-16, so a character outside the BMP (an emoji, say)
+# takes two columns in a Tk index while Python counts it as one
+_ASTRAL_RE = re.compile('[\U00010000-\U0010FFFF]')
+_ASTRAL_COLUMNS = 2 if TclVersion < 9 else 1
+
+_FONT_FAMILIES_CACHE = None
+
+def _font_families(root, config_manager=None, refresh=False):
+    """Return sorted font families, cached in memory and in the config file"""
+    global _FONT_FAMILIES_CACHE
+    if _FONT_FAMILIES_CACHE is None and not refresh and config_manager:
+        cached = config_manager.get('CACHE', 'font_families')
+        if cached:
+            # Stored as one JSON value so names starting with '#' or ';' or with
+            # leading spaces survive the round trip
+            try:
+                families = json.loads(cached)
+            except ValueError:
+                families = None
+            if isinstance(families, list):
+                _FONT_FAMILIES_CACHE = families
+    if _FONT_FAMILIES_CACHE is None or refresh:
+        _FONT_FAMILIES_CACHE = sorted(set(font.families(root)))
+        if config_manager:
+            config_manager.set('CACHE', 'font_families', json.dumps(_FONT_FAMILIES_CACHE))
+    return _FONT_FAMILIES_CACHE
+
+def _tk_column(text):
+    """Width of a string on one line, in Tk index columns"""
+    if _ASTRAL_COLUMNS == 1:
+        return len(text)
+    return len(text) + len(_ASTRAL_RE.findall(text))
+
+def _py_column(text, column):
+    """Offset into a line's text of the character at a Tk index column"""
+    if _ASTRAL_COLUMNS == 1 or not _ASTRAL_RE.search(text):
+        return column
+    width = 0
+    for offset, char in enumerate(text):
+        if width >= column:
+            return offset
+        width += _ASTRAL_COLUMNS if char > '\uffff' else 1
+    return len(text)
+
+@dataclass(slots=True)
+class EditorSettings:
+    """Typed snapshot of the settings read from the config file at startup"""
+    font_name: str = 'Consolas'
+    font_size: int = 12
+    theme: str = 'light'
+    word_wrap: bool = True
+    line_numbers: bool = True
+    auto_save: bool = True
+    window_width: int = 1000
+    window_height: int = 700
 
 class ConfigManager:
     """Manages application configuration and settings"""
     def __init__(self):
-        self.config = configparser.ConfigParser()
+        # No interpolation: cached values such as font names may contain '%'
+        self.config = configparser.ConfigParser(interpolation=None)
         self.config_file = CONFIG_FILE
         self.load_config()
     
@@ -66,9 +135,30 @@ class ConfigManager:
                 self.config.add_section('EDITOR')
             if not self.config.has_section('APPEARANCE'):
                 self.config.add_section('APPEARANCE')
+            if not self.config.has_section('CACHE'):
+                self.config.add_section('CACHE')
         except Exception as e:
             print(f"Error loading config: {e}")
             self.create_default_config()
+        self.settings = self.read_settings()
+    
+    def read_settings(self):
+        """Parse the typed settings once so callers don't re-read the parser"""
+        defaults = EditorSettings()
+        try:
+            return EditorSettings(
+                font_name=self.config.get('EDITOR', 'font_name', fallback=defaults.font_name),
+                font_size=self.config.getint('EDITOR', 'font_size', fallback=defaults.font_size),
+                theme=self.config.get('EDITOR', 'theme', fallback=defaults.theme),
+                word_wrap=self.config.getboolean('EDITOR', 'word_wrap', fallback=defaults.word_wrap),
+                line_numbers=self.config.getboolean('EDITOR', 'line_numbers', fallback=defaults.line_numbers),
+                auto_save=self.config.getboolean('EDITOR', 'auto_save', fallback=defaults.auto_save),
+                window_width=self.config.getint('APPEARANCE', 'window_width', fallback=defaults.window_width),
+                window_height=self.config.getint('APPEARANCE', 'window_height', fallback=defaults.window_height),
+            )
+        except (configparser.Error, ValueError) as e:
+            print(f"Error reading settings: {e}")
+            return defaults
     
     def create_default_config(self):
         """Create default configuration"""
@@ -84,6 +174,8 @@ class ConfigManager:
         self.config.set('APPEARANCE', 'window_width', '1000')
         self.config.set('APPEARANCE', 'window_height', '700')
         self.config.set('APPEARANCE', 'theme_color', 'blue')
+        
+        self.config.add_section('CACHE')
     
     def save_config(self):
         """Save configuration to file"""
@@ -97,14 +189,14 @@ class ConfigManager:
         """Get configuration value"""
         try:
             return self.config.get(section, option)
-        except:
+        except (configparser.Error, ValueError):
             return fallback
     
     def set(self, section, option, value):
         """Set configuration value"""
         try:
             self.config.set(section, option, str(value))
-        except:
+        except (configparser.Error, ValueError):
             pass
 
 class LineNumberCanvas(Canvas):
@@ -112,33 +204,171 @@ class LineNumberCanvas(Canvas):
     def __init__(self, master, text_widget, **kwargs):
         super().__init__(master, width=50, **kwargs)
         self.text_widget = text_widget
+        self._items = []
+        self._last_view = None
+        self._pending = None
+        self.line_height = font.Font(font=self.text_widget['font']).metrics('linespace')
         self.bind_events()
         self.redraw()
     
     def bind_events(self):
         """Bind events to update line numbers"""
-        self.text_widget.bind('<KeyRelease>', self.redraw)
-        self.text_widget.bind('<MouseWheel>', self.redraw)
-        self.text_widget.bind('<ButtonRelease>', self.redraw)
-        self.text_widget.bind('<Configure>', self.redraw)
-    
-    def redraw(self, event=None):
-        """Redraw line numbers"""
-        try:
-            self.delete('all')
-            i = self.text_widget.index('@0,0')
+        for sequence in ('<KeyRelease>', '<MouseWheel>', '<ButtonRelease>', '<Configure>'):
+            self.text_widget.bind(sequence, self.schedule_redraw, add='+')
+    
+    def refresh(self):
+        """Re-read the line height and redraw after a font or wrap change"""
+        self.line_height = font.Font(font=self.text_widget['font']).metrics('linespace')
+        self._last_view = None
+        self.schedule_redraw()
+    
+    def schedule_redraw(self, event=None):
+        """Coalesce redraw requests into a single idle callback"""
+        if self._pending is None:
+            self._pending = self.after_idle(self.redraw)
+    
+    def visible_lines(self, top):
+        """Return (y, line number) pairs for the lines shown in the text widget"""
+        lines = []
+        if self.text_widget.cget('wrap') == 'none':
+            # Without wrapping every line is one line-height tall, so only the
+            # first visible line needs a dlineinfo round-trip
+            dline = self.text_widget.dlineinfo(top)
+            if dline is None:
+                return lines
+            y = dline[1]
+            linenum = int(top.split('.')[0])
+            last = int(self.text_widget.index(END + '-1c').split('.')[0])
+            height = self.winfo_height()
+            while y <= height and linenum <= last:
+                lines.append((y, str(linenum)))
+                y += self.line_height
+                linenum += 1
+        else:
+            # Wrapped lines have varying heights, so ask Tk for each one
+            i = top
             while True:
                 dline = self.text_widget.dlineinfo(i)
                 if dline is None:
                     break
-                y = dline[1]
-                linenum = str(i).split('.')[0]
-                self.create_text(35, y, anchor='ne', text=linenum, 
-                               fill='gray', font=('Courier', 9))
+                lines.append((dline[1], str(i).split('.')[0]))
                 i = self.text_widget.index(f'{i}+1line')
+        return lines
+    
+    def redraw(self, event=None):
+        """Redraw line numbers, reusing canvas items from the previous pass"""
+        self._pending = None
+        try:
+            top = self.text_widget.index('@0,0')
+            view = (top, self.text_widget.index(END), self.winfo_height())
+            if view == self._last_view and not self.text_widget.edit_modified():
+                return
+            self._last_view = view
+            
+            lines = self.visible_lines(top)
+            for shown, (y, linenum) in enumerate(lines):
+                if shown < len(self._items):
+                    item = self._items[shown]
+                    self.coords(item, 35, y)
+                    self.itemconfigure(item, text=linenum, state='normal')
+                else:
+                    self._items.append(self.create_text(35, y, anchor='ne', text=linenum,
+                                                        fill='gray', font=('Courier', 9)))
+            
+            for item in self._items[len(lines):]:
+                self.itemconfigure(item, state='hidden')
         except Exception as e:
             print(f"Error redrawing line numbers: {e}")
 
+class TrackedText(Text):
+    """Text widget that keeps a running word count and document copy by intercepting its own edits"""
+    def __init__(self, master=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.word_count = 0
+        self._doc_cache = None
+        self.edit_count = 0  # bumped on every edit, so callers can tell when cached results are stale
+        self.edited_lines = None  # (first, last) lines changed since take_edited_lines()
+        # Rename the Tcl widget command and put a proxy in its place, so every
+        # insert/delete/replace -- including undo/redo and the class bindings --
+        # goes through _dispatch
+        self._orig = self._w + '_orig'
+        self.tk.call('rename', self._w, self._orig)
+        self.tk.createcommand(self._w, self._dispatch)
+    
+    def destroy(self):
+        """Remove the proxy and restore the original widget command"""
+        self.tk.deletecommand(self._w)
+        self.tk.call('rename', self._orig, self._w)
+        super().destroy()
+    
+    def get_all(self):
+        """Whole document without Tk's trailing newline, copied once per edit"""
+        if self._doc_cache is None:
+            self._doc_cache = self.tk.call(self._orig, 'get', '1.0', 'end-1c')
+        return self._doc_cache
+    
+    def take_edited_lines(self):
+        """Return the (first, last) line range edited since the last call, or None"""
+        lines, self.edited_lines = self.edited_lines, None
+        return lines
+    
+    def _mark_edited(self, first, last_before, last_after):
+        """Add an edit of lines first..last_before, now first..last_after, to the edited range"""
+        if self.edited_lines:
+            # Lines below the edit moved up or down with it
+            delta = last_after - last_before
+            start, stop = (n + delta if n > last_before else n for n in self.edited_lines)
+            first, last_after = min(start, first), max(stop, last_after)
+        self.edited_lines = (first, last_after)
+    
+    def _line(self, index):
+        """Line number of an index, clamped to the last line like Tk's edits are"""
+        line = int(str(self.tk.call(self._orig, 'index', index)).split('.')[0])
+        last = int(str(self.tk.call(self._orig, 'index', 'end-1c')).split('.')[0])
+        return min(line, last)
+    
+    def _words_in_lines(self, first, last):
+        """Count the words on lines first..last inclusive"""
+        return len(self.tk.call(self._orig, 'get', f'{first}.0', f'{last}.0 lineend').split())
+    
+    def _dispatch(self, *args):
+        """Forward a widget command, re-counting words only on the lines an edit touches"""
+        command = args[0] if args else ''
+        if command not in ('insert', 'delete', 'replace'):
+            return self.tk.call((self._orig,) + args)
+        
+        try:
+            if command == 'insert':
+                # insert index chars ?tagList chars tagList ...?
+                first = last = self._line(args[1])
+                added = sum(str(chars).count('\n') for chars in args[2::2])
+            elif command == 'delete' and len(args) > 3:
+                # Several ranges in one call; recount the whole document instead
+                first, last, added = 1, self._line(END), None
+            else:
+                first = self._line(args[1])
+                # A single-index delete removes one character, which may be the newline
+                # joining this line to the next
+                end = args[2] if len(args) > 2 else f'{args[1]}+1c'
+                last = max(self._line(end), first)
+                added = sum(str(chars).count('\n') for chars in args[3::2]) if command == 'replace' else 0
+            before = self._words_in_lines(first, last)
+        except TclError:
+            # Let the real command report the bad index
+            return self.tk.call((self._orig,) + args)
+        
+        result = self.tk.call((self._orig,) + args)
+        self._doc_cache = None
+        self.edit_count += 1
+        if added is None:
+            end = self._line(END)
+            self.word_count = self._words_in_lines(1, end)
+            self._mark_edited(1, last, end)
+        else:
+            self.word_count += self._words_in_lines(first, first + added) - before
+            self._mark_edited(first, last, first + added)
+        return result
+
 class SearchDialog:
     """Advanced search and replace dialog"""
     def __init__(self, parent, text_widget):
@@ -147,6 +377,13 @@ class SearchDialog:
         self.search_window = None
         self.last_search = ""
         self.current_match = None
+        self._compiled = {}
+        self._match_key = None
+        self._match_positions = []
+        self._match_starts = []
+        self._line_starts = [0]
+        self._content = ''
+        self._has_astral = False
         
     def show_dialog(self):
         """Show search/replace dialog"""
@@ -156,7 +393,7 @@ class SearchDialog:
             
         self.search_window = Toplevel(self.parent)
         self.search_window.title("Find & Replace")
-        self.search_window.geometry("400x200")
+        self.search_window.geometry("460x200")
         self.search_window.resizable(False, False)
         
         # Search frame
@@ -186,6 +423,7 @@ class SearchDialog:
         buttons_frame.pack(fill=X, padx=10, pady=5)
         
         Button(buttons_frame, text="Find Next", command=self.find_next).pack(side=LEFT, padx=2)
+        Button(buttons_frame, text="Find All", command=self.find_all).pack(side=LEFT, padx=2)
         Button(buttons_frame, text="Replace", command=self.replace_current).pack(side=LEFT, padx=2)
         Button(buttons_frame, text="Replace All", command=self.replace_all).pack(side=LEFT, padx=2)
         Button(buttons_frame, text="Close", command=self.close_dialog).pack(side=RIGHT, padx=2)
@@ -198,23 +436,16 @@ class SearchDialog:
         search_text = self.search_entry.get()
         if not search_text:
             return
-            
-        start_pos = self.text_widget.index(INSERT)
-        if search_text != self.last_search:
-            start_pos = "1.0"
-        
-        flags = []
-        if not self.match_case.get():
-            flags.append('nocase')
-        if self.whole_word.get():
-            flags.append('exact')
-        
-        pos = self.text_widget.search(search_text, start_pos, stopindex=END, 
-                                     count=None, *flags)
-        if pos:
-            self.text_widget.mark_set(INSERT, pos)
+        
+        matches = self.get_matches(search_text, self.match_case.get(), self.whole_word.get())
+        start = self.index_to_offset(INSERT) if search_text == self.last_search else 0
+        i = bisect.bisect_left(self._match_starts, start)
+        if i < len(matches):
+            pos = self.offset_to_index(matches[i][0])
+            end_pos = self.offset_to_index(matches[i][1])
+            # Leave the cursor after the match so the next search moves past it
+            self.text_widget.mark_set(INSERT, end_pos)
             self.text_widget.see(pos)
-            end_pos = f"{pos}+{len(search_text)}c"
             self.text_widget.tag_remove(SEL, "1.0", END)
             self.text_widget.tag_add(SEL, pos, end_pos)
             self.current_match = (pos, end_pos)
@@ -222,12 +453,89 @@ class SearchDialog:
         else:
             messagebox.showinfo("Search", "Text not found")
     
+    def find_all(self):
+        """Select every occurrence at once"""
+        search_text = self.search_entry.get()
+        if not search_text:
+            return
+        
+        matches = self.get_matches(search_text, self.match_case.get(), self.whole_word.get())
+        self.text_widget.tag_remove(SEL, "1.0", END)
+        if matches:
+            # Tk's tag add takes any number of ranges, so this is a single Tcl call
+            self.text_widget.tag_add(SEL, *[self.offset_to_index(offset)
+                                            for match in matches for offset in match])
+            self.text_widget.see(self.offset_to_index(matches[0][0]))
+            self.search_window.title(f"Find & Replace - {len(matches)} matches")
+        else:
+            self.search_window.title("Find & Replace")
+            messagebox.showinfo("Search", "Text not found")
+    
+    def get_regex(self, search_text, match_case, whole_word):
+        """Return the compiled Python pattern for the search options, cached per dialog"""
+        key = (search_text, match_case, whole_word)
+        regex = self._compiled.get(key)
+        if regex is None:
+            expr = re.escape(search_text)
+            if whole_word:
+                expr = r'\b' + expr + r'\b'
+            regex = re.compile(expr, 0 if match_case else re.IGNORECASE)
+            self._compiled[key] = regex
+        return regex
+    
+    def get_matches(self, search_text, match_case, whole_word):
+        """Return (start, end) character offsets of every match, cached until the options or text change"""
+        # Keyed on the widget's edit count too, so edits from anywhere (menus, undo,
+        # drops) make the cached offsets stale
+        key = (search_text, match_case, whole_word, self.text_widget.edit_count)
+        if key == self._match_key:
+            return self._match_positions
+        
+        # One copy of the buffer per search; later Find Next presses just bisect the cache
+        content = self.text_widget.get_all()
+        if match_case and not whole_word:
+            # Plain literal: str.find needs no regex at all
+            positions = []
+            size = len(search_text)
+            pos = content.find(search_text)
+            while pos != -1:
+                positions.append((pos, pos + size))
+                pos = content.find(search_text, pos + size)
+            self._match_positions = positions
+        else:
+            regex = self.get_regex(search_text, match_case, whole_word)
+            self._match_positions = [match.span() for match in regex.finditer(content)]
+        self._match_starts = [start for start, _ in self._match_positions]
+        self._line_starts = [0] + [match.end() for match in re.finditer('\n', content)]
+        # Only text with astral characters needs the slower column conversion
+        self._content = content
+        self._has_astral = _ASTRAL_COLUMNS > 1 and _ASTRAL_RE.search(content) is not None
+        self._match_key = key
+        return self._match_positions
+    
+    def offset_to_index(self, offset):
+        """Convert a character offset in the cached text to a Tk 'line.column' index"""
+        line = bisect.bisect_right(self._line_starts, offset)
+        start = self._line_starts[line - 1]
+        if self._has_astral:
+            return f"{line}.{_tk_column(self._content[start:offset])}"
+        return f"{line}.{offset - start}"
+    
+    def index_to_offset(self, index):
+        """Convert a Tk index to a character offset in the cached text"""
+        line, column = map(int, self.text_widget.index(index).split('.'))
+        line = min(line, len(self._line_starts))
+        start = self._line_starts[line - 1]
+        if self._has_astral:
+            stop = self._line_starts[line] - 1 if line < len(self._line_starts) else len(self._content)
+            column = _py_column(self._content[start:stop], column)
+        return start + column
+    
     def replace_current(self):
         """Replace current selection"""
         if self.current_match:
             replace_text = self.replace_entry.get()
-            self.text_widget.delete(self.current_match[0], self.current_match[1])
-            self.text_widget.insert(self.current_match[0], replace_text)
+            self.text_widget.replace(self.current_match[0], self.current_match[1], replace_text)
             self.find_next()
     
     def replace_all(self):
@@ -238,28 +546,22 @@ class SearchDialog:
         if not search_text:
             return
         
-        content = self.text_widget.get("1.0", END)
-        count = 0
+        # Use the same matches Find Next/Find All report
+        matches = self.get_matches(search_text, self.match_case.get(), self.whole_word.get())
+        spans = [(self.offset_to_index(start), self.offset_to_index(end)) for start, end in matches]
+        count = len(spans)
         
-        if not self.match_case.get():
-            if self.whole_word.get():
-                import re
-                pattern = r'\b' + re.escape(search_text) + r'\b'
-                content, count = re.subn(pattern, replace_text, content, flags=re.IGNORECASE)
-            else:
-                count = content.lower().count(search_text.lower())
-                content = content.replace(search_text, replace_text)
-        else:
-            if self.whole_word.get():
-                import re
-                pattern = r'\b' + re.escape(search_text) + r'\b'
-                content, count = re.subn(pattern, replace_text, content)
-            else:
-                count = content.count(search_text)
-                content = content.replace(search_text, replace_text)
+        # Edit in place and record the whole operation as one undo step; going from
+        # the last match back keeps the earlier indices valid
+        self.text_widget.edit_separator()
+        self.text_widget.config(autoseparators=False)
+        try:
+            for start, end in reversed(spans):
+                self.text_widget.replace(start, end, replace_text)
+        finally:
+            self.text_widget.config(autoseparators=True)
+            self.text_widget.edit_separator()
         
-        self.text_widget.delete("1.0", END)
-        self.text_widget.insert("1.0", content)
         messagebox.showinfo("Replace All", f"Replaced {count} occurrences")
     
     def close_dialog(self):
@@ -272,10 +574,28 @@ class TextEditor:
     def __init__(self):
         self.config_manager = ConfigManager()
         self.recent_files = []
-        self.current_file = None
-        self.auto_save_thread = None
+        self.recent_menu_paths = []
+        self._recent_valid = {}
+        self._current_file = None
+        self._current_basename = None
+        self._keyword_re = None
+        self._window_title = None
+        self._auto_save_id = None
+        # Auto-save writes happen on this worker so a slow disk can't stall typing
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._auto_save_future = None
         self.is_modified = False
         self.search_dialog = None
+        self._enchant_dict = None
+        self._spell_ok = None
+        self._pending_status = None
+        self._dirty_flags = 0
+        self._status_reset_id = None
+        self._hl_pending = None
+        self._wc_pending = None
+        self._shown_word_count = None
+        self._highlighted_view = None
+        self._viewport_pending = None
         
         self.setup_window()
         self.setup_variables()
@@ -288,21 +608,8 @@ class TextEditor:
         
     def setup_window(self):
         """Setup main window"""
-        # Always use regular Tk for better PyInstaller compatibility
-        self.window = Tk()
-        # If drag and drop is available and we're not in PyInstaller, enable it
-        if DRAG_DROP_AVAILABLE and not getattr(sys, 'frozen', False):
-            try:
-                self.window.destroy()
-                self.window = TkinterDnD.Tk()
-                print("TkinterDnD initialized successfully")
-            except Exception as e:
-                print(f"Failed to initialize TkinterDnD: {e}")
-                self.window = Tk()
-                # Move global declaration to the top of the function, not inside except
-                # Instead, set the variable as nonlocal or use a setter method
-                # But since DRAG_DROP_AVAILABLE is only used for feature toggling, just set it here
-                globals()['DRAG_DROP_AVAILABLE'] = False
+        # Fall back to regular Tk when drag and drop can't be enabled
+        self.window = self._try_enable_dnd() or Tk()
         self.window.title(f"{APP_NAME} v{APP_VERSION}")
         # Try to set icon, but don't fail if it doesn't exist
         try:
@@ -311,8 +618,8 @@ class TextEditor:
         except Exception as e:
             print(f"Could not load icon: {e}")
         # Window geometry
-        width = int(self.config_manager.get('APPEARANCE', 'window_width', '1000'))
-        height = int(self.config_manager.get('APPEARANCE', 'window_height', '700'))
+        width = self.config_manager.settings.window_width
+        height = self.config_manager.settings.window_height
         screen_width = self.window.winfo_screenwidth()
         screen_height = self.window.winfo_screenheight()
         x = int((screen_width - width) / 2)
@@ -322,14 +629,35 @@ class TextEditor:
         # Window protocol
         self.window.protocol("WM_DELETE_WINDOW", self.on_closing)
     
+    def _try_enable_dnd(self):
+        """Import tkinterdnd2 and create a drag-and-drop root window, if possible"""
+        global DRAG_DROP_AVAILABLE, DND_FILES
+        # PyInstaller builds ship without tkinterdnd2
+        if getattr(sys, 'frozen', False):
+            print("PyInstaller detected - drag and drop disabled")
+            return None
+        try:
+            from tkinterdnd2 import DND_FILES, TkinterDnD
+            window = TkinterDnD.Tk()
+        except ImportError:
+            print("tkinterdnd2 not available - drag and drop functionality disabled")
+            return None
+        except Exception as e:
+            print(f"Failed to initialize TkinterDnD: {e}")
+            return None
+        DRAG_DROP_AVAILABLE = True
+        print("TkinterDnD initialized successfully")
+        return window
+    
     def setup_variables(self):
         """Setup tkinter variables"""
-        self.font_name = StringVar(value=self.config_manager.get('EDITOR', 'font_name', 'Consolas'))
-        self.font_size = StringVar(value=self.config_manager.get('EDITOR', 'font_size', '12'))
-        self.theme_var = StringVar(value=self.config_manager.get('EDITOR', 'theme', 'light'))
-        self.word_wrap_var = BooleanVar(value=self.config_manager.get('EDITOR', 'word_wrap', 'True') == 'True')
-        self.line_numbers_var = BooleanVar(value=self.config_manager.get('EDITOR', 'line_numbers', 'True') == 'True')
-        self.auto_save_var = BooleanVar(value=self.config_manager.get('EDITOR', 'auto_save', 'True') == 'True')
+        settings = self.config_manager.settings
+        self.font_name = StringVar(value=settings.font_name)
+        self.font_size = StringVar(value=str(settings.font_size))
+        self.theme_var = StringVar(value=settings.theme)
+        self.word_wrap_var = BooleanVar(value=settings.word_wrap)
+        self.line_numbers_var = BooleanVar(value=settings.line_numbers)
+        self.auto_save_var = BooleanVar(value=settings.auto_save)
     
     def setup_widgets(self):
         """Setup main widgets"""
@@ -342,7 +670,7 @@ class TextEditor:
         self.text_frame = Frame(self.main_frame)
         self.text_frame.pack(fill=BOTH, expand=True, padx=5, pady=5)
         # Text area with scrollbars
-        self.text_area = Text(
+        self.text_area = TrackedText(
             self.text_frame,
             font=(self.font_name.get(), int(self.font_size.get())),
             undo=True,
@@ -357,7 +685,14 @@ class TextEditor:
         # Scrollbars
         self.v_scrollbar = Scrollbar(self.text_frame, orient=VERTICAL, command=self.text_area.yview)
         self.h_scrollbar = Scrollbar(self.text_frame, orient=HORIZONTAL, command=self.text_area.xview)
-        self.text_area.configure(yscrollcommand=self.v_scrollbar.set, xscrollcommand=self.h_scrollbar.set)
+        self.text_area.configure(yscrollcommand=self.on_yscroll, xscrollcommand=self.h_scrollbar.set)
+        # Syntax highlighting tags
+        self.text_area.tag_config('keyword', foreground='blue')
+        self.text_area.tag_config('string', foreground='green')
+        self.text_area.tag_config('comment', foreground='gray')
+        # Formatting tags; the font-based ones follow change_font
+        self.text_area.tag_config('underline', underline=True)
+        self.configure_format_tags()
         # Line numbers
         self.line_numbers = LineNumberCanvas(self.text_frame, self.text_area, bg='#f0f0f0')
         # Pack widgets
@@ -402,7 +737,7 @@ class TextEditor:
         Label(self.toolbar, text="Font:").pack(side=LEFT, padx=2)
         
         self.font_combo = ttk.Combobox(self.toolbar, textvariable=self.font_name, 
-                                      values=sorted(font.families()), width=12)
+                                      values=_font_families(self.window, self.config_manager), width=12)
         self.font_combo.pack(side=LEFT, padx=2)
         self.font_combo.bind('<<ComboboxSelected>>', self.change_font)
         
@@ -441,13 +776,18 @@ class TextEditor:
         self.status_frame = Frame(self.main_frame)
         self.status_frame.pack(fill=X, side=BOTTOM)
         
-        self.status_bar = Label(self.status_frame, text="Ready", anchor=W, relief=SUNKEN, bd=1)
+        # Labels follow StringVars so frequent updates are a variable set, not a configure
+        self.status_var = StringVar(value="Ready")
+        self.pos_var = StringVar(value="Ln 1, Col 1")
+        self.words_var = StringVar(value="Words: 0")
+        
+        self.status_bar = Label(self.status_frame, textvariable=self.status_var, anchor=W, relief=SUNKEN, bd=1)
         self.status_bar.pack(side=LEFT, fill=X, expand=True)
         
-        self.cursor_position = Label(self.status_frame, text="Ln 1, Col 1", anchor=E, relief=SUNKEN, bd=1)
+        self.cursor_position = Label(self.status_frame, textvariable=self.pos_var, anchor=E, relief=SUNKEN, bd=1)
         self.cursor_position.pack(side=RIGHT)
         
-        self.word_count = Label(self.status_frame, text="Words: 0", anchor=E, relief=SUNKEN, bd=1)
+        self.word_count = Label(self.status_frame, textvariable=self.words_var, anchor=E, relief=SUNKEN, bd=1)
         self.word_count.pack(side=RIGHT)
     
     def setup_menu(self):
@@ -543,14 +883,24 @@ class TextEditor:
         self.window.bind('<Control-minus>', lambda e: self.zoom_out())
         self.window.bind('<Control-0>', lambda e: self.reset_zoom())
         
-        # Text area bindings
-        self.text_area.bind('<KeyRelease>', self.on_text_change)
-        self.text_area.bind('<Button-1>', self.on_text_change)
-        self.text_area.bind('<MouseWheel>', self.on_text_change)
+        # Text area bindings (added alongside the line number canvas bindings)
+        self.text_area.bind('<KeyRelease>', lambda e: self.on_text_change(e, UI_CURSOR | UI_TEXT), add='+')
+        self.text_area.bind('<Button-1>', lambda e: self.on_text_change(e, UI_CURSOR), add='+')
+        # Edits that don't come from the keyboard (menu paste, undo, Replace All, drops)
+        self.text_area.bind('<<Modified>>', lambda e: self.on_text_change(e, UI_TEXT), add='+')
         self.text_area.bind('<Control-MouseWheel>', self.on_mouse_wheel)
-        
-        # Auto-complete and syntax highlighting
-        self.text_area.bind('<KeyRelease>', self.on_key_release)
+    
+    @property
+    def current_file(self):
+        """Path of the open file, or None for an untitled document"""
+        return self._current_file
+    
+    @current_file.setter
+    def current_file(self, path):
+        self._current_file = path
+        self._current_basename = os.path.basename(path) if path else None
+        self._keyword_re = _LANG_RE.get(os.path.splitext(path)[1].lower()) if path else None
+        self.update_window_title()
     
     # Drag and drop handler
     def on_drop(self, event):
@@ -570,18 +920,22 @@ class TextEditor:
     # File operations
     def new_file(self):
         """Create new file"""
+        # A failed auto-save leaves the document modified, so settle it before asking
+        self.wait_for_auto_save()
         if self.is_modified:
             if not self.ask_save_changes():
                 return
         
         self.text_area.delete(1.0, END)
-        self.current_file = None
+        self.reset_modified()
         self.is_modified = False
-        self.window.title(f"{APP_NAME} - Untitled")
+        self.current_file = None
+        self.update_word_count()
         self.update_status("New file created")
     
     def open_file(self, filepath=None):
         """Open file"""
+        self.wait_for_auto_save()
         if self.is_modified:
             if not self.ask_save_changes():
                 return
@@ -597,32 +951,52 @@ class TextEditor:
             )
         
         if filepath:
+            switched = False
             try:
-                with open(filepath, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                    self.text_area.delete(1.0, END)
-                    self.text_area.insert(1.0, content)
+                with open(filepath, 'r', encoding='utf-8', buffering=1 << 20) as file:
+                    first_chunk = file.read(READ_CHUNK_SIZE)
+                    # Switch files before streaming so redraws while loading highlight
+                    # for the new file type, not the old one
+                    switched = True
+                    self.current_file = filepath
+                    # The first chunk replaces the old document in a single edit; the
+                    # rest is inserted in chunks so the window keeps painting while
+                    # large files load
+                    self.text_area.replace(1.0, END, first_chunk)
+                    while chunk := file.read(READ_CHUNK_SIZE):
+                        self.text_area.insert(END, chunk)
+                        self.window.update_idletasks()
+                self.reset_modified()
                 
-                self.current_file = filepath
                 self.is_modified = False
-                self.window.title(f"{APP_NAME} - {os.path.basename(filepath)}")
+                # current_file was switched while the old document's flag was still set
+                self.update_window_title()
                 self.add_recent_file(filepath)
-                self.update_status(f"Opened: {os.path.basename(filepath)}")
+                self.update_status(f"Opened: {self._current_basename}")
+                self.update_word_count()
                 self.highlight_syntax()
                 
             except Exception as e:
+                if switched:
+                    # Never leave a partly loaded file where a save could write it out
+                    self.text_area.delete(1.0, END)
+                    self.reset_modified()
+                    self.is_modified = False
+                    self.current_file = None
+                    self.update_word_count()
                 messagebox.showerror("Error", f"Could not open file: {str(e)}")
     
     def save_file(self):
         """Save current file"""
         if self.current_file:
             try:
-                with open(self.current_file, 'w', encoding='utf-8') as file:
-                    file.write(self.text_area.get(1.0, END + '-1c'))
+                # Let a running auto-save finish so it can't replace this newer save
+                self.wait_for_auto_save()
+                self.write_file(self.current_file)
                 
                 self.is_modified = False
-                self.update_status(f"Saved: {os.path.basename(self.current_file)}")
-                self.window.title(f"{APP_NAME} - {os.path.basename(self.current_file)}")
+                self.update_status(f"Saved: {self._current_basename}")
+                self.update_window_title()
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Could not save file: {str(e)}")
@@ -643,18 +1017,26 @@ class TextEditor:
         
         if filepath:
             try:
-                with open(filepath, 'w', encoding='utf-8') as file:
-                    file.write(self.text_area.get(1.0, END + '-1c'))
+                self.wait_for_auto_save()
+                self.write_file(filepath)
                 
-                self.current_file = filepath
                 self.is_modified = False
-                self.window.title(f"{APP_NAME} - {os.path.basename(filepath)}")
+                self.current_file = filepath
                 self.add_recent_file(filepath)
-                self.update_status(f"Saved as: {os.path.basename(filepath)}")
+                self.update_status(f"Saved as: {self._current_basename}")
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Could not save file: {str(e)}")
     
+    def write_file(self, filepath):
+        """Write the text area to disk a block of lines at a time"""
+        last_line = int(self.text_area.index(END + '-1c').split('.')[0])
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as file:
+            for line in range(1, last_line + 1, WRITE_CHUNK_LINES):
+                stop = line + WRITE_CHUNK_LINES
+                stop_index = f"{stop}.0" if stop <= last_line else END + '-1c'
+                file.write(self.text_area.get(f"{line}.0", stop_index))
+    
     def ask_save_changes(self):
         """Ask user to save changes before closing"""
         result = messagebox.askyesnocancel(
@@ -727,7 +1109,10 @@ class TextEditor:
     def goto_line(self):
         """Go to specific line"""
         try:
-            line_num = simpledialog.askinteger("Go to Line", "Enter line number:")
+            # Tk keeps lines in a B-tree, so the line count is an O(log n) index lookup
+            last_line = int(self.text_area.index(END + '-1c').split('.')[0])
+            line_num = simpledialog.askinteger("Go to Line", f"Enter line number (1-{last_line}):",
+                                               minvalue=1, maxvalue=last_line, parent=self.window)
             if line_num:
                 self.text_area.mark_set(INSERT, f"{line_num}.0")
                 self.text_area.see(INSERT)
@@ -742,6 +1127,7 @@ class TextEditor:
             self.text_area.config(wrap='word')
         else:
             self.text_area.config(wrap='none')
+        self.line_numbers.refresh()
         self.update_status("Word wrap toggled")
     
     def toggle_line_numbers(self):
@@ -776,10 +1162,18 @@ class TextEditor:
         try:
             font_tuple = (self.font_name.get(), int(self.font_size.get()))
             self.text_area.config(font=font_tuple)
+            self.configure_format_tags()
+            self.line_numbers.refresh()
             self.update_status(f"Font changed to {self.font_name.get()} {self.font_size.get()}")
         except Exception as e:
             print(f"Error changing font: {e}")
     
+    def configure_format_tags(self):
+        """Give the bold and italic tags the current editor font"""
+        name, size = self.font_name.get(), int(self.font_size.get())
+        self.text_area.tag_config('bold', font=(name, size, 'bold'))
+        self.text_area.tag_config('italic', font=(name, size, 'italic'))
+    
     def toggle_theme(self):
         """Toggle between light and dark theme"""
         if self.theme_var.get() == 'light':
@@ -808,58 +1202,48 @@ class TextEditor:
     # Text formatting
     def toggle_bold(self):
         """Toggle bold formatting"""
-        try:
-            current_tags = self.text_area.tag_names(INSERT)
-            if 'bold' in current_tags:
-                self.text_area.tag_remove('bold', SEL_FIRST, SEL_LAST)
-            else:
-                self.text_area.tag_add('bold', SEL_FIRST, SEL_LAST)
-                self.text_area.tag_config('bold', font=(self.font_name.get(), int(self.font_size.get()), 'bold'))
-        except:
-            pass
+        self.toggle_tag('bold')
     
     def toggle_italic(self):
         """Toggle italic formatting"""
-        try:
-            current_tags = self.text_area.tag_names(INSERT)
-            if 'italic' in current_tags:
-                self.text_area.tag_remove('italic', SEL_FIRST, SEL_LAST)
-            else:
-                self.text_area.tag_add('italic', SEL_FIRST, SEL_LAST)
-                self.text_area.tag_config('italic', font=(self.font_name.get(), int(self.font_size.get()), 'italic'))
-        except:
-            pass
+        self.toggle_tag('italic')
     
     def toggle_underline(self):
         """Toggle underline formatting"""
-        try:
-            current_tags = self.text_area.tag_names(INSERT)
-            if 'underline' in current_tags:
-                self.text_area.tag_remove('underline', SEL_FIRST, SEL_LAST)
-            else:
-                self.text_area.tag_add('underline', SEL_FIRST, SEL_LAST)
-                self.text_area.tag_config('underline', underline=True)
-        except:
-            pass
+        self.toggle_tag('underline')
+    
+    def toggle_tag(self, tag):
+        """Add or remove a formatting tag on the selection, if there is one"""
+        selection = self.text_area.tag_ranges(SEL)
+        if not selection:
+            return
+        start, end = selection[0], selection[-1]
+        if tag in self.text_area.tag_names(INSERT):
+            self.text_area.tag_remove(tag, start, end)
+        else:
+            self.text_area.tag_add(tag, start, end)
     
     def change_color(self):
         """Change text color"""
-        try:
-            color = colorchooser.askcolor(title="Choose Color")[1]
-            if color:
-                self.text_area.tag_add('color', SEL_FIRST, SEL_LAST)
-                self.text_area.tag_config('color', foreground=color)
-        except:
-            pass
+        selection = self.text_area.tag_ranges(SEL)
+        if not selection:
+            return
+        color = colorchooser.askcolor(title="Choose Color")[1]
+        if color:
+            self.text_area.tag_add('color', selection[0], selection[-1])
+            self.text_area.tag_config('color', foreground=color)
     
     # Tools and utilities
     def show_word_count(self):
         """Show word count dialog"""
-        content = self.text_area.get(1.0, END)
-        words = len(content.split())
-        lines = content.count('\n')
+        content = self.text_area.get_all()
+        # The text area keeps a running word count, and counting characters avoids
+        # building stripped copies of the document
+        words = self.text_area.word_count
+        newlines = content.count('\n')
+        lines = newlines + 1
         chars = len(content)
-        chars_no_spaces = len(content.replace(' ', '').replace('\n', ''))
+        chars_no_spaces = chars - content.count(' ') - newlines
         
         messagebox.showinfo("Word Count Statistics", 
                           f"Words: {words}\n"
@@ -869,8 +1253,7 @@ class TextEditor:
     
     def show_char_count(self):
         """Show character count"""
-        content = self.text_area.get(1.0, END)
-        chars = len(content)
+        chars = len(self.text_area.get_all())
         messagebox.showinfo("Character Count", f"Total characters: {chars}")
     
     def spell_check(self):
@@ -880,12 +1263,18 @@ class TextEditor:
             return
         
         try:
-            import enchant
-            dictionary = enchant.Dict("en_US")
-            content = self.text_area.get(1.0, END)
-            words = re.findall(r'\b\w+\b', content)
+            # Importing enchant and loading the dictionary is slow, so do it once, and
+            # remember results across runs since documents repeat the same words
+            if self._enchant_dict is None:
+                import enchant
+                self._enchant_dict = enchant.Dict("en_US")
+                self._spell_ok = functools.lru_cache(maxsize=50000)(self._enchant_dict.check)
+            content = self.text_area.get_all()
+            words = content.translate(_WORD_STRIPPER).split()
             
-            misspelled = [word for word in words if not dictionary.check(word)]
+            # Check each distinct word once, then report every occurrence
+            unknown = {word for word in set(words) if not self._spell_ok(word)}
+            misspelled = [word for word in words if word in unknown]
             
             if misspelled:
                 messagebox.showinfo("Spell Check", f"Misspelled words found: {len(misspelled)}\n"
@@ -910,7 +1299,10 @@ class TextEditor:
             )
             
             if filename:
-                content = self.text_area.get(1.0, END)
+                from reportlab.pdfgen import canvas
+                from reportlab.lib.pagesizes import letter
+                
+                content = self.text_area.get_all()
                 
                 c = canvas.Canvas(filename, pagesize=letter)
                 width, height = letter
@@ -919,24 +1311,14 @@ class TextEditor:
                 text_obj = c.beginText(50, height - 50)
                 text_obj.setFont("Helvetica", 12)
                 
-                # Split content into lines
-                lines = content.split('\n')
-                
-                for line in lines:
-                    # Handle long lines by wrapping
+                # Wrap long lines; shorter ones are kept as-is to preserve indentation
+                lines = []
+                for line in content.split('\n'):
                     if len(line) > 80:
-                        words = line.split()
-                        current_line = ""
-                        for word in words:
-                            if len(current_line + word) < 80:
-                                current_line += word + " "
-                            else:
-                                text_obj.textLine(current_line.strip())
-                                current_line = word + " "
-                        if current_line:
-                            text_obj.textLine(current_line.strip())
+                        lines.extend(textwrap.wrap(line, 80) or [''])
                     else:
-                        text_obj.textLine(line)
+                        lines.append(line)
+                text_obj.textLines('\n'.join(lines), trim=0)
                 
                 c.drawText(text_obj)
                 c.save()
@@ -959,21 +1341,31 @@ class TextEditor:
     def load_recent_files(self):
         """Load recent files from JSON"""
         try:
-            if os.path.exists(RECENT_FILES_FILE):
-                with open(RECENT_FILES_FILE, 'r') as f:
-                    self.recent_files = json.load(f)
-            self.update_recent_menu()
+            # Open directly rather than checking os.path.exists first: one syscall, no race
+            with open(RECENT_FILES_FILE, 'rb') as f:
+                self.recent_files = _loads(f.read())
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading recent files: {e}")
             self.recent_files = []
+        self.update_recent_menu()
     
     def save_recent_files(self):
         """Save recent files to JSON"""
+        # Write to a temporary file first so a crash can't leave a truncated list
+        tmp_file = RECENT_FILES_FILE + '.tmp'
         try:
-            with open(RECENT_FILES_FILE, 'w') as f:
-                json.dump(self.recent_files, f)
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(self.recent_files))
+            os.replace(tmp_file, RECENT_FILES_FILE)
         except Exception as e:
             print(f"Error saving recent files: {e}")
+            # Don't leave a half-written temporary file behind
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
     
     def add_recent_file(self, filepath):
         """Add file to recent files list"""
@@ -989,46 +1381,162 @@ class TextEditor:
         self.update_recent_menu()
     
     def update_recent_menu(self):
-        """Update recent files menu"""
-        self.recent_menu.delete(0, 'end')
-        
-        if not self.recent_files:
-            self.recent_menu.add_command(label="No recent files", state=DISABLED)
+        """Update recent files menu, relabelling existing entries in place"""
+        self.recent_menu_paths = [f for f in self.recent_files if self.recent_file_exists(f)]
+        if self.recent_menu_paths:
+            entries = [(os.path.basename(f), NORMAL) for f in self.recent_menu_paths]
         else:
-            for filepath in self.recent_files:
-                if os.path.exists(filepath):
-                    filename = os.path.basename(filepath)
-                    self.recent_menu.add_command(
-                        label=filename,
-                        command=lambda f=filepath: self.open_file(f)
-                    )
+            entries = [("No recent files", DISABLED)]
+        
+        last = self.recent_menu.index('end')
+        existing = 0 if last is None else last + 1
+        for i, (label, state) in enumerate(entries):
+            if i < existing:
+                self.recent_menu.entryconfigure(i, label=label, state=state)
+            else:
+                # Entries open by position, so their commands never need replacing
+                self.recent_menu.add_command(label=label, state=state,
+                                             command=lambda i=i: self.open_recent_file(i))
+        if existing > len(entries):
+            self.recent_menu.delete(len(entries), 'end')
+    
+    def recent_file_exists(self, filepath):
+        """Check a recent file still exists, re-statting it at most every RECENT_CHECK_TTL seconds"""
+        now = time.monotonic()
+        checked = self._recent_valid.get(filepath)
+        if checked is not None and now - checked < RECENT_CHECK_TTL:
+            return True
+        if os.path.exists(filepath):
+            self._recent_valid[filepath] = now
+            return True
+        self._recent_valid.pop(filepath, None)
+        return False
+    
+    def open_recent_file(self, index):
+        """Open the file shown at the given recent files menu position"""
+        if index < len(self.recent_menu_paths):
+            self.open_file(self.recent_menu_paths[index])
     
     # Auto-save functionality
     def start_auto_save(self):
-        """Start auto-save timer"""
-        if self.auto_save_var.get():
-            self.auto_save_timer()
+        """Start auto-save timer on the Tk event loop"""
+        self._auto_save_id = self.window.after(AUTO_SAVE_INTERVAL * 1000, self._auto_save_tick)
+    
+    def _auto_save_tick(self):
+        """Save pending changes, then schedule the next tick"""
+        modified = self.is_modified or self.text_area.edit_modified()
+        busy = self._auto_save_future is not None
+        if self.auto_save_var.get() and modified and self.current_file and not busy:
+            # Tk isn't thread-safe: take the snapshot here and only write it on the worker
+            content = self.text_area.get_all()
+            filepath = self.current_file
+            self._auto_save_future = self._io_pool.submit(self._write_snapshot, filepath, content)
+            self.is_modified = False
+            self.update_window_title()
+            self.window.after(100, self._check_auto_save, filepath)
+        
+        # Keep ticking while disabled so re-enabling it in Preferences takes effect
+        self._auto_save_id = self.window.after(AUTO_SAVE_INTERVAL * 1000, self._auto_save_tick)
+    
+    def _write_snapshot(self, filepath, content):
+        """Write a text snapshot over the file (runs on the worker)"""
+        # Write in place like write_file, so symlinks, mode and ownership are kept
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as file:
+            file.write(content)
+    
+    def _check_auto_save(self, filepath):
+        """Poll the auto-save worker from the Tk loop and report how it went"""
+        future = self._auto_save_future
+        if future is None:
+            return
+        if not future.done():
+            self.window.after(100, self._check_auto_save, filepath)
+            return
+        self._auto_save_future = None
+        if filepath != self.current_file:
+            # Another document is open now; this result isn't about it
+            return
+        error = future.exception()
+        if error is None:
+            self.update_status(f"Auto-saved: {os.path.basename(filepath)}")
+        else:
+            # The document is still unsaved; say so and try again on the next tick
+            self.is_modified = True
+            self.update_window_title()
+            self.update_status(f"Auto-save failed: {error}")
     
-    def auto_save_timer(self):
-        """Auto-save timer function"""
-        if self.auto_save_var.get() and self.is_modified and self.current_file:
-            self.save_file()
-        
-        # Schedule next auto-save
-        if self.auto_save_var.get():
-            self.window.after(AUTO_SAVE_INTERVAL * 1000, self.auto_save_timer)
+    def wait_for_auto_save(self):
+        """Block until a running auto-save has finished writing"""
+        future, self._auto_save_future = self._auto_save_future, None
+        if future is not None and future.exception() is not None:
+            self.is_modified = True
     
     # Event handlers
-    def on_text_change(self, event=None):
-        """Handle text changes"""
-        self.is_modified = True
-        self.update_cursor_position()
+    def on_text_change(self, event=None, flags=UI_CURSOR | UI_TEXT):
+        """Handle text changes, coalescing bursts of events into one update"""
+        self._dirty_flags |= flags
+        if self._pending_status:
+            return
+        self._pending_status = self.window.after(50, self._flush_ui)
+    
+    def _flush_ui(self):
+        """Apply every status update requested since the last flush in one pass"""
+        self._pending_status = None
+        flags, self._dirty_flags = self._dirty_flags, 0
+        index = self.text_area.index(INSERT)
+        if flags & UI_CURSOR:
+            self.update_cursor_position(index)
+        if flags & UI_TEXT and self.text_area.edit_modified():
+            was_modified, self.is_modified = self.is_modified, True
+            # The heavier work waits until typing pauses
+            self._hl_pending = self.reschedule(self._hl_pending, 150, self._do_highlight)
+            self._wc_pending = self.reschedule(self._wc_pending, 300, self._do_word_count)
+            self.reset_modified()
+            if not was_modified:
+                self.update_window_title()
+    
+    def on_yscroll(self, first, last):
+        """Track the vertical view: move the scrollbar and refresh what came into view"""
+        self.v_scrollbar.set(first, last)
+        # Tk calls this for every kind of scroll (wheel, keys, scrollbar drag, resize)
+        self.line_numbers.schedule_redraw()
+        if self._viewport_pending is None:
+            self._viewport_pending = self.window.after_idle(self._rehighlight_viewport)
+    
+    def _rehighlight_viewport(self):
+        """Highlight the visible window if it changed since it was last highlighted"""
+        self._viewport_pending = None
+        view = (self.text_area.index('@0,0'), self.text_area.winfo_height())
+        if view != self._highlighted_view:
+            self.highlight_syntax()
+    
+    def reschedule(self, after_id, delay, callback):
+        """Cancel a pending after() callback, if any, and schedule it again"""
+        if after_id:
+            self.window.after_cancel(after_id)
+        return self.window.after(delay, callback)
+    
+    def _do_highlight(self):
+        """Re-highlight the lines edited since the last pass"""
+        self._hl_pending = None
+        lines = self.text_area.take_edited_lines()
+        if lines:
+            # Edits off screen are picked up by _rehighlight_viewport once scrolled to
+            top = int(self.text_area.index('@0,0').split('.')[0])
+            bottom = int(self.text_area.index(f'@0,{self.text_area.winfo_height()}').split('.')[0])
+            first = max(lines[0], top - HIGHLIGHT_MARGIN)
+            last = min(lines[1], bottom + HIGHLIGHT_MARGIN)
+            if first <= last:
+                self.highlight_syntax(f"{first}.0", f"{last}.0 lineend")
+    
+    def _do_word_count(self):
+        """Show the word count once typing pauses"""
+        self._wc_pending = None
         self.update_word_count()
-        self.update_window_title()
     
-    def on_key_release(self, event=None):
-        """Handle key release events"""
-        self.highlight_syntax()
+    def reset_modified(self):
+        """Clear the Text modified flag once an edit has been handled"""
+        self.text_area.edit_modified(False)
     
     def on_mouse_wheel(self, event):
         """Handle mouse wheel for zoom"""
@@ -1039,75 +1547,80 @@ class TextEditor:
                 self.zoom_out()
             return "break"
     
-    def highlight_syntax(self):
-        """Basic syntax highlighting for Python files"""
-        if not self.current_file or not self.current_file.endswith('.py'):
+    def highlight_syntax(self, start=None, end=None):
+        """Basic keyword highlighting for known file types, by default around the visible window only"""
+        keyword_re = self._keyword_re
+        if keyword_re is None:
             return
         
-        content = self.text_area.get(1.0, END)
+        if start is None:
+            top = self.text_area.index('@0,0')
+            self._highlighted_view = (top, self.text_area.winfo_height())
+            start = f"{top} -{HIGHLIGHT_MARGIN} lines"
+            end = f"@0,{self.text_area.winfo_height()} +{HIGHLIGHT_MARGIN} lines lineend"
+        start = self.text_area.index(f"{start} linestart")
+        end = self.text_area.index(end or END)
+        content = self.text_area.get(start, end)
         
         # Clear existing tags
-        self.text_area.tag_remove('keyword', 1.0, END)
-        self.text_area.tag_remove('string', 1.0, END)
-        self.text_area.tag_remove('comment', 1.0, END)
-        
-        # Python keywords
-        keywords = ['def', 'class', 'if', 'elif', 'else', 'for', 'while', 'try', 'except', 'finally',
-                   'import', 'from', 'as', 'return', 'yield', 'lambda', 'with', 'assert', 'break',
-                   'continue', 'pass', 'raise', 'and', 'or', 'not', 'in', 'is', 'True', 'False', 'None']
-        
-        # Highlight keywords
-        for keyword in keywords:
-            start = '1.0'
-            while True:
-                pos = self.text_area.search(r'\b' + keyword + r'\b', start, stopindex=END, regexp=True)
-                if not pos:
-                    break
-                end = f"{pos}+{len(keyword)}c"
-                self.text_area.tag_add('keyword', pos, end)
-                start = end
-        
-        # Configure tags
-        self.text_area.tag_config('keyword', foreground='blue')
-        self.text_area.tag_config('string', foreground='green')
-        self.text_area.tag_config('comment', foreground='gray')
+        self.text_area.tag_remove('keyword', start, end)
+        self.text_area.tag_remove('string', start, end)
+        self.text_area.tag_remove('comment', start, end)
+        
+        # Map match offsets to 'line.column' through the offsets where each line starts
+        first_line = int(start.split('.')[0])
+        line_starts = [0] + [match.end() for match in re.finditer('\n', content)]
+        astral = _ASTRAL_COLUMNS > 1 and _ASTRAL_RE.search(content) is not None
+        
+        def to_index(offset):
+            line = bisect.bisect_right(line_starts, offset) - 1
+            start = line_starts[line]
+            column = _tk_column(content[start:offset]) if astral else offset - start
+            return f"{first_line + line}.{column}"
+        
+        # Tk's tag add accepts any number of ranges, so tag every match in one call
+        spans = []
+        for match in keyword_re.finditer(content):
+            spans.append(to_index(match.start()))
+            spans.append(to_index(match.end()))
+        if spans:
+            self.text_area.tag_add('keyword', *spans)
     
     # Status and UI updates
     def update_status(self, message):
         """Update status bar"""
-        self.status_bar.config(text=message)
-        self.window.after(3000, lambda: self.status_bar.config(text="Ready"))
+        self.status_var.set(message)
+        # Restart the timer so only the latest message's reset stays queued
+        self._status_reset_id = self.reschedule(self._status_reset_id, 3000, self._reset_status)
     
-    def update_cursor_position(self):
+    def _reset_status(self):
+        """Return the status bar to its idle message"""
+        self._status_reset_id = None
+        self.status_var.set("Ready")
+    
+    def update_cursor_position(self, index=None):
         """Update cursor position in status bar"""
         try:
-            line, col = self.text_area.index(INSERT).split('.')
-            self.cursor_position.config(text=f"Ln {line}, Col {col}")
+            line, col = (index or self.text_area.index(INSERT)).split('.')
+            self.pos_var.set(f"Ln {line}, Col {col}")
         except:
-            self.cursor_position.config(text="Ln 1, Col 1")
+            self.pos_var.set("Ln 1, Col 1")
     
     def update_word_count(self):
-        """Update word count in status bar"""
-        try:
-            content = self.text_area.get(1.0, END)
-            words = len(content.split())
-            self.word_count.config(text=f"Words: {words}")
-        except:
-            self.word_count.config(text="Words: 0")
+        """Update word count in status bar from the text area's running count"""
+        count = self.text_area.word_count
+        if count != self._shown_word_count:
+            self._shown_word_count = count
+            self.words_var.set(f"Words: {count}")
     
     def update_window_title(self):
-        """Update window title"""
-        if self.current_file:
-            filename = os.path.basename(self.current_file)
-            if self.is_modified:
-                self.window.title(f"{APP_NAME} - {filename} *")
-            else:
-                self.window.title(f"{APP_NAME} - {filename}")
-        else:
-            if self.is_modified:
-                self.window.title(f"{APP_NAME} - Untitled *")
-            else:
-                self.window.title(f"{APP_NAME} - Untitled")
+        """Update window title, skipping the Tk call when it hasn't changed"""
+        title = f"{APP_NAME} - {self._current_basename or 'Untitled'}"
+        if self.is_modified:
+            title += " *"
+        if title != self._window_title:
+            self._window_title = title
+            self.window.title(title)
     
     # Preferences and settings
     def show_preferences(self):
@@ -1126,8 +1639,11 @@ class TextEditor:
         font_frame.pack(fill=X, pady=5)
         
         Label(font_frame, text="Font:").pack(side=LEFT)
+        # Re-enumerate here so fonts installed since the list was cached show up
+        families = _font_families(self.window, self.config_manager, refresh=True)
+        self.font_combo.configure(values=families)
         font_combo = ttk.Combobox(font_frame, textvariable=self.font_name, 
-                                 values=sorted(font.families()), width=15)
+                                 values=families, width=15)
         font_combo.pack(side=LEFT, padx=5)
         
         Label(font_frame, text="Size:").pack(side=LEFT, padx=(10, 0))
@@ -1263,10 +1779,14 @@ Built with Python {sys.version.split()[0]}
     
     def on_closing(self):
         """Handle window closing"""
+        self.wait_for_auto_save()
         if self.is_modified:
             if not self.ask_save_changes():
                 return
         
+        if self._auto_save_id:
+            self.window.after_cancel(self._auto_save_id)
+        self._io_pool.shutdown(wait=True)
         self.save_settings()
         self.window.destroy()
     
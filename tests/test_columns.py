@@ -0,0 +1,47 @@
+import os
+import sys
+import unittest
+from tkinter import Tcl
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app
+
+
+class FakeText:
+    """Just enough of TrackedText for SearchDialog's offset bookkeeping"""
+    def __init__(self, content):
+        self.content = content
+        self.edit_count = 0
+
+    def get_all(self):
+        return self.content
+
+    def index(self, index):
+        return index
+
+
+class ColumnTests(unittest.TestCase):
+    def test_tk_column_matches_tcl(self):
+        tcl = Tcl()
+        for text in ('x foo', 'x\U0001F600 foo', '\U0001F600\U0001F600a'):
+            self.assertEqual(app._tk_column(text), int(tcl.call('string', 'length', text)))
+
+    def test_py_column_inverts_tk_column(self):
+        text = 'x\U0001F600 foo'
+        for offset in range(len(text) + 1):
+            self.assertEqual(app._py_column(text, app._tk_column(text[:offset])), offset)
+
+    def test_search_offsets_on_emoji_line(self):
+        content = 'first line\nx\U0001F600 foo foo'
+        dialog = app.SearchDialog(None, FakeText(content))
+        matches = dialog.get_matches('foo', True, False)
+        tcl = Tcl()
+        column = int(tcl.call('string', 'first', 'foo', content.split('\n')[1]))
+        self.assertEqual(dialog.offset_to_index(matches[0][0]), f'2.{column}')
+        self.assertEqual(dialog.offset_to_index(matches[0][1]), f'2.{column + 3}')
+        self.assertEqual(dialog.index_to_offset(f'2.{column}'), matches[0][0])
+
+
+if __name__ == '__main__':
+    unittest.main()